@@ -8,7 +8,6 @@ from typing import Optional
 import click
 
 from dcheck_enterprise_runner.audit import build_audit_metadata
-from dcheck_enterprise_runner.runner import run_from_spec
 from dcheck_enterprise_runner.spec import load_and_validate_spec
 
 
@@ -75,5 +74,9 @@ def run_cmd(
             click.echo(f"  {i}. {t.name}  modules={t.modules}")
         return
 
+    # Deferred: dry-runs never execute anything, so don't pay for the runner
+    # import graph (redaction, io, planner) on that path.
+    from dcheck_enterprise_runner.runner import run_from_spec
+
     rc = run_from_spec(spec=spec, audit=audit, resume=resume, limit=limit)
     raise SystemExit(rc)
\ No newline at end of file
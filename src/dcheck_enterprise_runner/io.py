@@ -1,41 +1,140 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:
+    import orjson  # C-backed encoder; big win on large per-table payloads
+except ImportError:  # keep stdlib fallback so unit tests run without the dep
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(data: Any, *, indent: bool = False) -> bytes:
+    """
+    Serialize to sorted-keys JSON bytes via orjson when available,
+    stdlib json otherwise.
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches stdlib behavior: YAML configs readily
+        # produce numeric dict keys, which orjson otherwise refuses.
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except TypeError:
+            # orjson caps ints at 64 bits (default= is never consulted for
+            # ints); fall through to stdlib, which handles arbitrary
+            # precision like the baseline did.
+            pass
+    return json.dumps(data, indent=2 if indent else None, sort_keys=True, default=str).encode("utf-8")
+
+
+def _loads(line: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+@functools.lru_cache(maxsize=256)
+def _ensure_dir_cached(str_path: str) -> None:
+    os.makedirs(str_path, exist_ok=True)
 
 
 def ensure_dir(path: Path) -> None:
-    path.mkdir(parents=True, exist_ok=True)
+    """
+    mkdir -p, memoized per directory: the write helpers call this on every
+    invocation but a run only ever touches a handful of directories, so
+    repeats become a dict lookup instead of a syscall. Assumes nothing
+    deletes output directories mid-run.
+    """
+    _ensure_dir_cached(os.fspath(path))
 
 
-def write_json(path: Path, data: Dict[str, Any]) -> None:
+def write_json(path: Path, data: Dict[str, Any], *, pretty: bool = False) -> None:
+    """
+    Write a JSON file. Compact by default (still jq-friendly); pass
+    pretty=True for human-facing files like summary.json.
+    """
     ensure_dir(path.parent)
-    path.write_text(json.dumps(data, indent=2, sort_keys=True, default=str), encoding="utf-8")
+    path.write_bytes(_dumps(data, indent=pretty))
 
 
-def read_jsonl(path: Path) -> List[Dict[str, Any]]:
+def append_jsonl(path: Path, rec: Dict[str, Any]) -> None:
     """
-    Read JSON Lines file. Returns [] if file does not exist.
+    Append a single record to a JSON Lines file.
+    NOTE: append is not safe on UC Volumes; prefer `write_jsonl_overwrite` there.
     """
-    if not path.exists():
-        return []
+    ensure_dir(path.parent)
+    with path.open("ab") as f:
+        f.write(_dumps(rec) + b"\n")
+
 
-    out: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
+class JsonlAppender:
+    """
+    JSONL writer that keeps the file handle open for its whole lifetime, so
+    each record costs a single write+flush instead of the mkdir/open/close
+    round-trip that `append_jsonl` pays per call. The handle is opened
+    lazily on the first write, so construction never raises and callers can
+    treat a failing `write` as the signal to fall back to another strategy.
+    NOTE: relies on append mode; not safe on UC Volumes / DBFS fuse.
+    """
+
+    def __init__(self, path: Path, *, append: bool = True) -> None:
+        self._path = path
+        self._mode = "ab" if append else "wb"
+        self._f: Any = None
+
+    def __enter__(self) -> "JsonlAppender":
+        return self
+
+    def write(self, rec: Dict[str, Any]) -> None:
+        if self._f is None:
+            ensure_dir(self._path.parent)
+            self._f = self._path.open(self._mode)
+        self._f.write(_dumps(rec) + b"\n")
+        self._f.flush()
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from a JSON Lines file, one line at a time.
+    Yields nothing if the file does not exist.
+    """
+    if not path.exists():
+        return
+    with path.open("rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            out.append(json.loads(line))
-    return out
+            yield _loads(line)
+
+
+def read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """
+    Read JSON Lines file into a list. Returns [] if file does not exist.
+    Prefer `iter_jsonl` for large files.
+    """
+    return list(iter_jsonl(path))
 
 
 def write_jsonl_overwrite(path: Path, records: Iterable[Dict[str, Any]]) -> None:
     """
     UC Volumes-safe writer: overwrite entire file each time (no append).
+    Serializes all records first and writes once, so the per-record
+    Python->C write calls collapse into a single buffer flush.
     """
     ensure_dir(path.parent)
-    with path.open("w", encoding="utf-8") as f:
-        for rec in records:
-            f.write(json.dumps(rec, sort_keys=True, default=str) + "\n")
\ No newline at end of file
+    path.write_bytes(b"".join(_dumps(rec) + b"\n" for rec in records))
@@ -1,20 +1,40 @@
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
 from dcheck_enterprise_runner.spec import EnterpriseSpec
 
+# All substitutions ("/" and ":" -> "_", "." -> "__") fused into one C-level
+# translate pass; maketrans maps chars to replacement strings of any length.
+_TBL_TRANS = str.maketrans({"/": "_", ":": "_", ".": "__"})
+
+
+def _safe_table_filename(table_name: str) -> str:
+    # make stable file name
+    return table_name.translate(_TBL_TRANS) + ".json"
+
 
 @dataclass(frozen=True)
 class TableJob:
     name: str
     modules: List[str]
     config: Dict[str, Any]
+    output_filename: str
 
 
 def build_plan(spec: EnterpriseSpec) -> List[TableJob]:
     jobs: List[TableJob] = []
+    seen: set[str] = set()
     for t in spec.tables:
-        jobs.append(TableJob(name=t.name, modules=t.modules, config=t.config))
-    return jobs
\ No newline at end of file
+        fname = _safe_table_filename(t.name)
+        if fname in seen:
+            # Distinct table names can sanitize to the same file (e.g.
+            # "a.b.c" vs "a.b/c"); disambiguate with a short stable hash so
+            # one report doesn't overwrite another.
+            digest = hashlib.blake2b(t.name.encode("utf-8"), digest_size=4).hexdigest()
+            fname = f"{fname[: -len('.json')]}-{digest}.json"
+        seen.add(fname)
+        jobs.append(TableJob(name=t.name, modules=t.modules, config=t.config, output_filename=fname))
+    return jobs
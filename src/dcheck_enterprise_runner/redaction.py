@@ -5,15 +5,43 @@ from typing import Any, Dict, List, Tuple
 
 # Very defensive heuristics. This is NOT the primary masking implementation.
 # It's a safety belt to avoid storing raw PII if a module accidentally leaks it.
-_EMAIL_RE = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.IGNORECASE)
-_PHONE_RE = re.compile(r"\+?\d[\d\s\-]{6,}\d")
-_FNR_RE = re.compile(r"\b\d{11}\b")
+#
+# The three patterns are fused into one alternation so every string is scanned
+# once instead of three times. Order matters: FNR (11 digits) must come before
+# the phone branch so it wins the overlap. The phone branch requires a leading
+# "+" or internal separators, which avoids flagging bare numeric IDs and keeps
+# backtracking bounded.
+_PII_RE = re.compile(
+    r"(?P<EMAIL>[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,})"
+    r"|(?P<FNR>\b\d{11}\b)"
+    r"|(?P<PHONE>\+(?:\d[ \-]?){7,14}\d|\b(?:\d{2,4}[ \-]){2,4}\d{2,4}\b)",
+    re.IGNORECASE,
+)
+_REPL = {
+    "EMAIL": "[REDACTED_EMAIL]",
+    "FNR": "[REDACTED_FNR]",
+    "PHONE": "[REDACTED_PHONE]",
+}
 
 
 def contains_obvious_pii(text: str) -> bool:
     if not text:
         return False
-    return bool(_EMAIL_RE.search(text) or _PHONE_RE.search(text) or _FNR_RE.search(text))
+    # Cheap prefilter: most strings in a report (column names, statuses,
+    # short messages) contain no "@", no "+" and fewer than 6 digits, so we
+    # can skip the regex dispatch entirely on the common path. Every pattern
+    # above needs at least one of those to match: 6 is the minimum of the
+    # separator phone branch (two 2-digit groups plus a 2-digit tail).
+    if "@" not in text and "+" not in text:
+        digits = 0
+        for c in text:
+            if c.isdigit():
+                digits += 1
+                if digits >= 6:
+                    break
+        if digits < 6:
+            return False
+    return bool(_PII_RE.search(text))
 
 
 def redact_string(text: str) -> str:
@@ -23,45 +51,142 @@ def redact_string(text: str) -> str:
     if not isinstance(text, str):
         return text  # type: ignore[return-value]
 
-    text = _EMAIL_RE.sub("[REDACTED_EMAIL]", text)
-    text = _FNR_RE.sub("[REDACTED_FNR]", text)
-    text = _PHONE_RE.sub("[REDACTED_PHONE]", text)
-    return text
+    return _PII_RE.sub(lambda m: _REPL[m.lastgroup], text)
 
 
-def redact_report_payload(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+def _format_path(node: Any) -> str:
+    """
+    Render a parent-linked path node (a chain of (parent, segment) pairs)
+    into the dotted "a.b[0].c" form. Only called on actual redaction hits.
+    """
+    segments: List[Any] = []
+    while node is not None:
+        node, seg = node
+        segments.append(seg)
+    out = ""
+    for seg in reversed(segments):
+        if isinstance(seg, int):
+            out += f"[{seg}]"
+        else:
+            out += f".{seg}" if out else str(seg)
+    return out
+
+
+# Known-safe subtrees of the report payload: runner-controlled metadata that
+# never carries user data, so the walk skips them wholesale.
+# Top-level keys and (parent, child) pairs; together they express
+# {"audit", "schema_version", "execution.config", "dataset.column_names"}.
+_SAFE_TOP_KEYS = {"audit", "schema_version"}
+_SAFE_NESTED_KEYS = {("execution", "config"), ("dataset", "column_names")}
+
+# Defensive bound against cyclic or absurdly nested payloads.
+_MAX_DEPTH = 64
+
+
+def redact_report_payload(
+    payload: Dict[str, Any], *, path_cap: int = 200
+) -> Tuple[Dict[str, Any], int, List[str]]:
     """
     Redact likely PII from known high-risk fields (samples/findings/message-like strings).
-    Returns (new_payload, redaction_events).
+    Mutates the payload in place and returns (payload, event_count, paths).
+    Redaction never stops, but at most `path_cap` paths are recorded so a
+    PII-heavy payload can't blow up the path list (event_count is the true
+    total).
+    """
+    count = 0
+    paths: List[str] = []
+
+    def _record(node: Any, suffix: str = "") -> None:
+        nonlocal count
+        count += 1
+        if len(paths) < path_cap:
+            paths.append(_format_path(node) + suffix)
+
+    # Iterative walk: (container, key, value, path_node, depth). Path nodes
+    # are (parent, segment) pairs so the dotted path string is only built
+    # when a hit is recorded, not for every node. Scalar non-strings never
+    # get pushed at all.
+    stack: List[Tuple[Any, Any, Any, Any, int]] = [(None, None, payload, None, 0)]
+    while stack:
+        container, key, value, node, depth = stack.pop()
+        if isinstance(value, str):
+            if contains_obvious_pii(value):
+                _record(node)
+                container[key] = redact_string(value)
+        elif isinstance(value, dict):
+            if depth >= _MAX_DEPTH:
+                _record(node, " (max depth reached; subtree not scanned)")
+                continue
+            for k, v in reversed(value.items()):
+                if isinstance(v, (str, dict, list)):
+                    if depth == 0 and k in _SAFE_TOP_KEYS:
+                        continue
+                    if depth == 1 and (key, k) in _SAFE_NESTED_KEYS:
+                        continue
+                    stack.append((value, k, v, (node, k), depth + 1))
+        elif isinstance(value, list):
+            if depth >= _MAX_DEPTH:
+                _record(node, " (max depth reached; subtree not scanned)")
+                continue
+            for i in range(len(value) - 1, -1, -1):
+                v = value[i]
+                if isinstance(v, (str, dict, list)):
+                    stack.append((value, i, v, (node, i), depth + 1))
+
+    return payload, count, paths
+
+
+def redact_known_fields(
+    payload: Dict[str, Any], *, path_cap: int = 200
+) -> Tuple[Dict[str, Any], int, List[str]]:
+    """
+    Fast path for payloads shaped by _serialize_report: the only free-form
+    strings a module can leak into are results[*].message and string leaves
+    anywhere under results[*].metrics, so only those are scanned instead of
+    walking the whole tree. Same mutate-in-place contract and return shape
+    as redact_report_payload.
     """
-    redactions: List[str] = []
-
-    def _walk(x: Any, path: str) -> Any:
-        # strings
-        if isinstance(x, str):
-            if contains_obvious_pii(x):
-                redactions.append(path)
-                return redact_string(x)
-            return x
-
-        # lists
-        if isinstance(x, list):
-            return [_walk(v, f"{path}[{i}]") for i, v in enumerate(x)]
-
-        # dicts
-        if isinstance(x, dict):
-            out: Dict[str, Any] = {}
-            for k, v in x.items():
-                kp = f"{path}.{k}" if path else str(k)
-                # prioritize redacting likely sample-bearing keys
-                if str(k).lower() in {"sample", "samples", "findings", "matches", "examples", "value"}:
-                    out[k] = _walk(v, kp)
-                else:
-                    out[k] = _walk(v, kp)
-            return out
-
-        return x
-
-    new_payload = _walk(payload, "")  # type: ignore[assignment]
-    assert isinstance(new_payload, dict)
-    return new_payload, redactions
\ No newline at end of file
+    count = 0
+    paths: List[str] = []
+
+    def _record(path: str) -> None:
+        nonlocal count
+        count += 1
+        if len(paths) < path_cap:
+            paths.append(path)
+
+    def _scan_metrics(metrics: Dict[str, Any], root: str) -> None:
+        # metrics subtrees are tiny and bounded, but must be covered fully:
+        # the safety belt can't be weaker than the generic walk it replaces.
+        stack: List[Tuple[Any, Any, Any, str]] = [
+            (metrics, k, v, f"{root}.{k}") for k, v in metrics.items() if isinstance(v, (str, dict, list))
+        ]
+        while stack:
+            container, key, value, path = stack.pop()
+            if isinstance(value, str):
+                if contains_obvious_pii(value):
+                    container[key] = redact_string(value)
+                    _record(path)
+            elif isinstance(value, dict):
+                for k, v in value.items():
+                    if isinstance(v, (str, dict, list)):
+                        stack.append((value, k, v, f"{path}.{k}"))
+            else:
+                for j, v in enumerate(value):
+                    if isinstance(v, (str, dict, list)):
+                        stack.append((value, j, v, f"{path}[{j}]"))
+
+    results = payload.get("results")
+    if isinstance(results, list):
+        for i, r in enumerate(results):
+            if not isinstance(r, dict):
+                continue
+            msg = r.get("message")
+            if isinstance(msg, str) and contains_obvious_pii(msg):
+                r["message"] = redact_string(msg)
+                _record(f"results[{i}].message")
+            metrics = r.get("metrics")
+            if isinstance(metrics, dict):
+                _scan_metrics(metrics, f"results[{i}].metrics")
+
+    return payload, count, paths
\ No newline at end of file
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from dcheck_enterprise_runner.io import ensure_dir, read_jsonl, write_json, write_jsonl_overwrite
-from dcheck_enterprise_runner.planner import build_plan
-from dcheck_enterprise_runner.redaction import redact_report_payload
+from dcheck_enterprise_runner.io import JsonlAppender, ensure_dir, iter_jsonl, write_json, write_jsonl_overwrite
+from dcheck_enterprise_runner.planner import TableJob, build_plan
+from dcheck_enterprise_runner.redaction import redact_known_fields, redact_report_payload
 from dcheck_enterprise_runner.spec import EnterpriseSpec
 
 _SCHEMA_VERSION = "dcheck-enterprise-run-report/v1"
@@ -45,40 +49,113 @@ def _normalize_output_path(p: str) -> Path:
     return Path(p)
 
 
+def _append_unsafe_path(p: Path) -> bool:
+    """
+    True when writing somewhere append mode is not supported and writers
+    must overwrite whole files: the DBFS fuse mount (/dbfs/...) and UC
+    Volumes (/Volumes/<catalog>/<schema>/<vol>/...).
+    """
+    s = str(p)
+    return s in ("/dbfs", "/Volumes") or s.startswith(("/dbfs/", "/Volumes/"))
+
+
 def run_from_spec(spec: EnterpriseSpec, audit: Dict[str, Any], resume: bool, limit: Optional[int]) -> int:
     out_dir = _normalize_output_path(spec.run.output_path)
     ensure_dir(out_dir)
+    ensure_dir(out_dir / "tables")
 
     state_path = out_dir / "run_state.jsonl"
+    completed_path = out_dir / "run_completed.txt"
     summary_path = out_dir / "summary.json"
 
     jobs = build_plan(spec)
     if limit is not None:
         jobs = jobs[:limit]
 
-    # Load state events (resume) or start fresh. Avoid append due to UC Volumes limitations.
-    state_events: List[Dict[str, Any]] = read_jsonl(state_path) if resume else []
+    completed_list: List[str] = []
+    if resume:
+        if completed_path.exists():
+            # Plain-text sidecar: one completed table name per line. Cheaper
+            # than deriving the set from the (audit-only) JSONL event log.
+            completed_list = [
+                ln.strip() for ln in completed_path.read_text(encoding="utf-8").splitlines() if ln.strip()
+            ]
+        else:
+            # Older runs have no sidecar; fall back to scanning the event log.
+            completed_list = [rec.get("table") for rec in iter_jsonl(state_path) if rec.get("status") == "completed"]
+    else:
+        # Fresh run: drop the sidecar like the state log, so stale
+        # completions from a previous run can't be picked up by a later
+        # --resume of this one.
+        completed_path.unlink(missing_ok=True)
+    completed = set(completed_list)
+
+    # DBFS fuse and UC Volumes do not support append, so there the state log
+    # and sidecar keep their contents in memory and overwrite the whole file
+    # on every event (the original strategy). Elsewhere a persistent append
+    # handle is much cheaper. If a mount we didn't recognize rejects append
+    # at runtime, the writers fail over to overwrite mode on the first error
+    # instead of silently dropping events for the rest of the run.
+    append_unsafe = _append_unsafe_path(out_dir)
+    state_log: Optional[JsonlAppender] = None if append_unsafe else JsonlAppender(state_path, append=resume)
+    state_events: List[Dict[str, Any]] = []
+    if append_unsafe and resume:
+        state_events = list(iter_jsonl(state_path))
+    sidecar_append = not append_unsafe
+
+    # Serializes state/sidecar writes when tables run on pool workers.
+    log_lock = threading.Lock()
 
     def emit_state(event: Dict[str, Any]) -> None:
         """
-        UC Volumes-safe state writing: keep events in memory and overwrite JSONL each time.
         Best-effort: state logging should not crash the run.
         """
-        try:
+        nonlocal state_log
+        with log_lock:
+            if state_log is not None:
+                try:
+                    state_log.write(event)
+                    return
+                except Exception:
+                    # Append rejected (e.g. an unrecognized append-unsafe
+                    # mount): close the handle, seed the overwrite buffer
+                    # with whatever made it to disk, and switch strategies.
+                    try:
+                        state_log.close()
+                    except Exception:
+                        pass
+                    state_log = None
+                    try:
+                        state_events.extend(iter_jsonl(state_path))
+                    except Exception:
+                        pass
             state_events.append(event)
-            write_jsonl_overwrite(state_path, state_events)
-        except Exception:
-            # Do not crash the entire run if state logging fails
-            pass
+            try:
+                write_jsonl_overwrite(state_path, state_events)
+            except Exception:
+                # Do not crash the entire run if state logging fails
+                pass
 
-    completed = set()
-    if resume:
-        for rec in state_events:
+    def mark_completed(table_name: str) -> None:
+        """
+        Best-effort write to the resume sidecar: append where supported,
+        whole-file rewrite otherwise (with the same runtime failover as the
+        state log).
+        """
+        nonlocal sidecar_append
+        with log_lock:
+            completed_list.append(table_name)
+            if sidecar_append:
+                try:
+                    with completed_path.open("a", encoding="utf-8") as f:
+                        f.write(table_name + "\n")
+                    return
+                except Exception:
+                    sidecar_append = False
             try:
-                if rec.get("status") == "completed":
-                    completed.add(rec.get("table"))
+                completed_path.write_text("".join(n + "\n" for n in completed_list), encoding="utf-8")
             except Exception:
-                continue
+                pass
 
     # Summary object kept small in memory
     run_summary: Dict[str, Any] = {
@@ -90,13 +167,16 @@ def run_from_spec(spec: EnterpriseSpec, audit: Dict[str, Any], resume: bool, lim
             "fail_on": spec.run.fail_on,
             "continue_on_error": spec.run.continue_on_error,
             "allow_pii_output": spec.run.allow_pii_output,
+            "parallelism": spec.run.parallelism,
         },
         "audit": audit,
         "tables_total": len(jobs),
         "tables_completed": 0,
         "tables_failed": 0,
         "tables_skipped": 0,
-        "table_results": [],  # list of small per-table summaries only
+        # Preallocated one slot per job and assigned by index; unfilled
+        # (skipped) slots are dropped after the loop.
+        "table_results": [None] * len(jobs),
     }
 
     # Ensure SparkSession exists in CLI subprocess (Databricks `!` runs in a separate process)
@@ -113,82 +193,69 @@ def run_from_spec(spec: EnterpriseSpec, audit: Dict[str, Any], resume: bool, lim
     from dcheck.api import dc  # type: ignore
 
     overall_failed = False
-
-    for idx, job in enumerate(jobs, start=1):
-        if job.name in completed:
-            run_summary["tables_skipped"] += 1
-            emit_state({"ts_utc": _utc_now(), "table": job.name, "status": "skipped", "reason": "resume"})
-            continue
-
-        started = time.time()
-        emit_state({"ts_utc": _utc_now(), "table": job.name, "status": "started", "index": idx, "total": len(jobs)})
-
-        table_out = out_dir / "tables" / _safe_table_filename(job.name)
-        ensure_dir(table_out.parent)
-
-        try:
-            # dc() supports table auto-load when given a string. Provide table_name as well for preflight paths.
-            report_obj = dc(job.name, table_name=job.name, modules=job.modules, config=job.config, render=False)
-
-            payload = _serialize_report(report_obj, table_name=job.name, modules=job.modules, config=job.config, audit=audit)
-
-            redaction_events: List[str] = []
-            if not spec.run.allow_pii_output:
-                payload, redaction_events = redact_report_payload(payload)
-                if redaction_events:
-                    payload.setdefault("redaction", {})
-                    payload["redaction"].update(
-                        {
-                            "applied": True,
-                            "reason": "allow_pii_output=false",
-                            "paths": redaction_events[:200],  # cap to avoid huge files
-                        }
-                    )
-
-            write_json(table_out, payload)
-
-            counts = payload.get("summary", {}).get("status_counts") or _status_counts(payload.get("results", []))
-            failed = _should_fail(counts, spec.run.fail_on)
-
-            run_summary["tables_completed"] += 1
-            run_summary["table_results"].append(
-                {
-                    "table": job.name,
-                    "output_file": str(table_out),
-                    "status_counts": counts,
-                    "duration_sec": round(time.time() - started, 3),
-                    "failed": bool(failed),
-                    "redaction_applied": bool(redaction_events),
-                }
-            )
-
-            emit_state({"ts_utc": _utc_now(), "table": job.name, "status": "completed", "failed": bool(failed)})
-
-            if failed:
+    total = len(jobs)
+
+    with state_log if state_log is not None else nullcontext():
+        runnable: List[Tuple[int, TableJob]] = []
+        for idx, job in enumerate(jobs, start=1):
+            if job.name in completed:
+                run_summary["tables_skipped"] += 1
+                emit_state({"ts_utc": _utc_now(), "table": job.name, "status": "skipped", "reason": "resume"})
+            else:
+                runnable.append((idx, job))
+
+        def record(idx: int, entry: Dict[str, Any], failed: bool) -> None:
+            """
+            Fold one table result into the summary. Only ever called from the
+            coordinating thread, so no lock is needed.
+            """
+            nonlocal overall_failed
+            run_summary["table_results"][idx - 1] = entry
+            if "exception" in entry:
                 run_summary["tables_failed"] += 1
+            else:
+                run_summary["tables_completed"] += 1
+                if failed:
+                    run_summary["tables_failed"] += 1
+            if failed:
                 overall_failed = True
-                if not spec.run.continue_on_error:
-                    break
 
-        except Exception as e:
-            overall_failed = True
-            run_summary["tables_failed"] += 1
-            emit_state({"ts_utc": _utc_now(), "table": job.name, "status": "error", "error": f"{type(e).__name__}: {e}"})
-            run_summary["table_results"].append(
-                {
-                    "table": job.name,
-                    "output_file": None,
-                    "status_counts": {"error": 1},
-                    "duration_sec": round(time.time() - started, 3),
-                    "failed": True,
-                    "exception": f"{type(e).__name__}: {e}",
+        if spec.run.parallelism > 1 and len(runnable) > 1:
+            # Overlap Spark-submit latency across tables. dc() is I/O-heavy
+            # (job submit + result fetch), so threads spend most of their time
+            # off the GIL.
+            with ThreadPoolExecutor(max_workers=spec.run.parallelism) as pool:
+                futures = {
+                    pool.submit(_run_one_table, job, idx, total, spec, out_dir, audit, dc, emit_state, mark_completed): idx
+                    for idx, job in runnable
                 }
-            )
-            if not spec.run.continue_on_error:
-                break
+                for fut in as_completed(futures):
+                    entry, failed = fut.result()
+                    record(futures[fut], entry, failed)
+                    if failed and not spec.run.continue_on_error:
+                        # Not-yet-started tables are dropped; in-flight ones
+                        # finish during pool shutdown below.
+                        for f in futures:
+                            f.cancel()
+                        break
+            # Pool shutdown waited for in-flight tables: they wrote their
+            # reports and sidecar entries, so fold any results the early
+            # break skipped into the summary to keep it consistent with
+            # what is on disk. No-op when the loop ran to completion.
+            for fut, i in futures.items():
+                if run_summary["table_results"][i - 1] is None and not fut.cancelled():
+                    entry, failed = fut.result()
+                    record(i, entry, failed)
+        else:
+            for idx, job in runnable:
+                entry, failed = _run_one_table(job, idx, total, spec, out_dir, audit, dc, emit_state, mark_completed)
+                record(idx, entry, failed)
+                if failed and not spec.run.continue_on_error:
+                    break
 
+    run_summary["table_results"] = [r for r in run_summary["table_results"] if r is not None]
     run_summary["run"]["finished_utc"] = _utc_now()
-    write_json(summary_path, run_summary)
+    write_json(summary_path, run_summary, pretty=True)
 
     # Exit codes:
     # 0 -> ok/warnings only
@@ -196,6 +263,97 @@ def run_from_spec(spec: EnterpriseSpec, audit: Dict[str, Any], resume: bool, lim
     return 1 if overall_failed else 0
 
 
+def _run_one_table(
+    job: TableJob,
+    idx: int,
+    total: int,
+    spec: EnterpriseSpec,
+    out_dir: Path,
+    audit: Dict[str, Any],
+    dc: Callable[..., Any],
+    emit_state: Callable[[Dict[str, Any]], None],
+    mark_completed: Callable[[str], None],
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Execute a single table job end-to-end: run dc(), serialize, redact, write
+    the per-table JSON and log state events. Returns (table_result, failed).
+    Exceptions are captured into the result entry so pool workers never raise.
+    """
+    started = time.time()
+    # One timestamp per same-instant event group; _utc_now allocates a
+    # datetime + tzinfo + string each call, which adds up over thousands of
+    # tables.
+    ts_start = _utc_now()
+    emit_state({"ts_utc": ts_start, "table": job.name, "status": "started", "index": idx, "total": total})
+
+    # Parent dir is created once in run_from_spec; write_json's (memoized)
+    # ensure_dir covers stragglers. Filename was precomputed (and
+    # collision-checked) by build_plan.
+    table_out = out_dir / "tables" / job.output_filename
+
+    try:
+        # dc() supports table auto-load when given a string. Provide table_name as well for preflight paths.
+        report_obj = dc(job.name, table_name=job.name, modules=job.modules, config=job.config, render=False)
+
+        payload = _serialize_report(report_obj, table_name=job.name, modules=job.modules, config=job.config, audit=audit)
+
+        redaction_count = 0
+        if not spec.run.allow_pii_output:
+            # Serialized reports only expose free-form strings in
+            # results[*].message/metrics, so the targeted scan is the default;
+            # deep_redaction opts back into the full-tree walk.
+            redact = redact_report_payload if spec.run.deep_redaction else redact_known_fields
+            payload, redaction_count, redaction_paths = redact(payload)
+            if redaction_count:
+                payload.setdefault("redaction", {})
+                payload["redaction"].update(
+                    {
+                        "applied": True,
+                        "reason": "allow_pii_output=false",
+                        "count": redaction_count,
+                        "paths": redaction_paths,  # capped during the walk
+                    }
+                )
+
+        write_json(table_out, payload)
+
+        counts = payload.get("summary", {}).get("status_counts") or _status_counts(payload.get("results", []))
+        failed = _should_fail(counts, spec.run.fail_on)
+
+        ts_end = _utc_now()
+        emit_state({"ts_utc": ts_end, "table": job.name, "status": "completed", "failed": bool(failed)})
+        mark_completed(job.name)
+
+        return (
+            {
+                "table": job.name,
+                "output_file": str(table_out),
+                "status_counts": counts,
+                "duration_sec": round(time.time() - started, 3),
+                "failed": bool(failed),
+                "redaction_applied": bool(redaction_count),
+                "finished_utc": ts_end,
+            },
+            bool(failed),
+        )
+
+    except Exception as e:
+        ts_err = _utc_now()
+        emit_state({"ts_utc": ts_err, "table": job.name, "status": "error", "error": f"{type(e).__name__}: {e}"})
+        return (
+            {
+                "table": job.name,
+                "output_file": None,
+                "status_counts": {"error": 1},
+                "duration_sec": round(time.time() - started, 3),
+                "failed": True,
+                "exception": f"{type(e).__name__}: {e}",
+                "finished_utc": ts_err,
+            },
+            True,
+        )
+
+
 def _serialize_report(
     report_obj: Any, *, table_name: str, modules: List[str], config: Dict[str, Any], audit: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -212,10 +370,15 @@ def _serialize_report(
     results_json: List[Dict[str, Any]] = []
     if isinstance(results, list):
         for r in results:
+            # name/status repeat heavily across rules ("ok", "fail", shared
+            # rule names); interning makes duplicates share one object, which
+            # shrinks the working set and speeds up sorted-key encoding.
+            name = getattr(r, "name", None)
+            status = getattr(r, "status", None)
             results_json.append(
                 {
-                    "name": getattr(r, "name", None),
-                    "status": getattr(r, "status", None),
+                    "name": sys.intern(name) if isinstance(name, str) else name,
+                    "status": sys.intern(status) if isinstance(status, str) else status,
                     "message": getattr(r, "message", None),
                     "metrics": getattr(r, "metrics", None) or {},
                 }
@@ -233,8 +396,3 @@ def _serialize_report(
         "audit": audit,
         "generated_utc": _utc_now(),
     }
-
-
-def _safe_table_filename(table_name: str) -> str:
-    # make stable file name
-    return table_name.replace("/", "_").replace(":", "_").replace(".", "__") + ".json"
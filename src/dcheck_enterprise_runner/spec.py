@@ -1,33 +1,31 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
-import yaml
+import msgspec
 
 
 _ALLOWED_STATUSES = {"ok", "warning", "error", "fail"}
 
 
-@dataclass
-class RunSpec:
-    id: str
-    output_path: str
-    fail_on: List[str] = field(default_factory=lambda: ["error"])
+class RunSpec(msgspec.Struct):
+    id: str = "dcheck-run"
+    output_path: str = "./out"
+    fail_on: List[str] = msgspec.field(default_factory=lambda: ["error"])
     continue_on_error: bool = True
     allow_pii_output: bool = False
+    deep_redaction: bool = False
+    parallelism: int = 1
 
 
-@dataclass
-class TableSpec:
+class TableSpec(msgspec.Struct):
     name: str
-    modules: List[str] = field(default_factory=lambda: ["core_quality"])
-    config: Dict[str, Any] = field(default_factory=dict)
+    modules: List[str] = msgspec.field(default_factory=lambda: ["core_quality"])
+    config: Dict[str, Any] = msgspec.field(default_factory=dict)
 
 
-@dataclass
-class EnterpriseSpec:
+class EnterpriseSpec(msgspec.Struct):
     run: RunSpec
     tables: List[TableSpec]
 
@@ -38,16 +36,38 @@ class SpecError(ValueError):
 
 def load_and_validate_spec(path: Path) -> EnterpriseSpec:
     data = _load_yaml(path)
-    run = _parse_run(data.get("run", {}), path)
-    tables = _parse_tables(data.get("tables", None), path)
+    _normalize(data, path)
 
-    if not tables:
+    try:
+        # C-level schema validation: required fields, types and defaults are
+        # all enforced by msgspec instead of hand-rolled isinstance chains.
+        spec = msgspec.convert(data, EnterpriseSpec, strict=False)
+    except msgspec.ValidationError as e:
+        raise SpecError(f"{path}: {e}") from None
+
+    if not spec.tables:
         raise SpecError(f"{path}: 'tables' must contain at least 1 table entry")
 
-    return EnterpriseSpec(run=run, tables=tables)
+    unknown = [s for s in spec.run.fail_on if s not in _ALLOWED_STATUSES]
+    if unknown:
+        raise SpecError(f"{path}: unknown statuses in run.fail_on: {unknown}. Allowed: {sorted(_ALLOWED_STATUSES)}")
+
+    if spec.run.parallelism < 1:
+        raise SpecError(f"{path}: 'run.parallelism' must be >= 1")
+
+    # msgspec only enforces presence and type, not non-emptiness.
+    for i, t in enumerate(spec.tables, start=1):
+        if not t.name:
+            raise SpecError(f"{path}: tables[{i}].name is required and must be a non-empty string")
+
+    return spec
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
+    # Deferred: PyYAML is only needed when a spec is actually loaded, not for
+    # importers that just want the Struct types (e.g. planner, notebooks).
+    import yaml
+
     raw = path.read_text(encoding="utf-8")
     obj = yaml.safe_load(raw)
     if not isinstance(obj, dict):
@@ -55,61 +75,37 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
     return obj
 
 
-def _parse_run(run: Dict[str, Any], path: Path) -> RunSpec:
+def _normalize(data: Dict[str, Any], path: Path) -> None:
+    """
+    Pre-convert conveniences msgspec can't express: comma-separated string
+    shorthand for list fields, the 'output' alias, and falsy -> default
+    coercions. Mutates the loaded YAML dict in place.
+    """
+    run = data.setdefault("run", {})
     if not isinstance(run, dict):
         raise SpecError(f"{path}: 'run' must be an object")
 
-    run_id = run.get("id") or "dcheck-run"
-    output_path = run.get("output_path") or run.get("output") or "./out"
+    run["id"] = str(run.get("id") or "dcheck-run")
+    run["output_path"] = str(run.get("output_path") or run.get("output") or "./out")
 
     fail_on = run.get("fail_on", ["error"])
     if isinstance(fail_on, str):
-        fail_on = [s.strip().lower() for s in fail_on.split(",") if s.strip()]
+        fail_on = [s for s in fail_on.split(",") if s.strip()]
     if not isinstance(fail_on, list) or not all(isinstance(x, str) for x in fail_on):
         raise SpecError(f"{path}: 'run.fail_on' must be a list of strings or comma-separated string")
-
-    fail_on_norm = [s.strip().lower() for s in fail_on if s.strip()]
-    unknown = [s for s in fail_on_norm if s not in _ALLOWED_STATUSES]
-    if unknown:
-        raise SpecError(f"{path}: unknown statuses in run.fail_on: {unknown}. Allowed: {sorted(_ALLOWED_STATUSES)}")
-
-    continue_on_error = bool(run.get("continue_on_error", True))
-    allow_pii_output = bool(run.get("allow_pii_output", False))
-
-    return RunSpec(
-        id=str(run_id),
-        output_path=str(output_path),
-        fail_on=fail_on_norm or ["error"],
-        continue_on_error=continue_on_error,
-        allow_pii_output=allow_pii_output,
-    )
-
-
-def _parse_tables(tables: Any, path: Path) -> List[TableSpec]:
-    if tables is None:
-        raise SpecError(f"{path}: missing required 'tables' list")
-    if not isinstance(tables, list):
-        raise SpecError(f"{path}: 'tables' must be a list")
-
-    out: List[TableSpec] = []
-    for i, t in enumerate(tables, start=1):
-        if not isinstance(t, dict):
-            raise SpecError(f"{path}: tables[{i}] must be an object")
-        name = t.get("name")
-        if not name or not isinstance(name, str):
-            raise SpecError(f"{path}: tables[{i}].name is required and must be a string")
-
-        modules = t.get("modules", ["core_quality"])
-        if isinstance(modules, str):
-            modules = [s.strip() for s in modules.split(",") if s.strip()]
-        if not isinstance(modules, list) or not all(isinstance(x, str) for x in modules):
-            raise SpecError(f"{path}: tables[{i}].modules must be list[str] or comma-separated string")
-
-        config = t.get("config", {})
-        if config is None:
-            config = {}
-        if not isinstance(config, dict):
-            raise SpecError(f"{path}: tables[{i}].config must be an object")
-
-        out.append(TableSpec(name=name, modules=[m.strip() for m in modules if m.strip()], config=config))
-    return out
\ No newline at end of file
+    run["fail_on"] = [s.strip().lower() for s in fail_on if s.strip()] or ["error"]
+
+    tables = data.get("tables")
+    if isinstance(tables, list):
+        for t in tables:
+            if not isinstance(t, dict):
+                continue  # let msgspec report the type error with context
+            modules = t.get("modules")
+            if isinstance(modules, str):
+                modules = [s for s in modules.split(",") if s.strip()]
+            # Only normalize all-string lists; anything else passes through
+            # untouched so msgspec rejects it instead of coercing it.
+            if isinstance(modules, list) and all(isinstance(m, str) for m in modules):
+                t["modules"] = [m.strip() for m in modules if m.strip()]
+            if t.get("config") is None:
+                t["config"] = {}
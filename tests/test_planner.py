@@ -0,0 +1,16 @@
+from dcheck_enterprise_runner.planner import build_plan, _safe_table_filename
+from dcheck_enterprise_runner.spec import EnterpriseSpec, RunSpec, TableSpec
+
+def test_safe_table_filename():
+    assert _safe_table_filename("cat.sch.tbl") == "cat__sch__tbl.json"
+    assert _safe_table_filename("a/b:c") == "a_b_c.json"
+
+def test_build_plan_disambiguates_filename_collisions():
+    spec = EnterpriseSpec(
+        run=RunSpec(),
+        tables=[TableSpec(name="a.b"), TableSpec(name="a__b")],
+    )
+    jobs = build_plan(spec)
+    assert jobs[0].output_filename == "a__b.json"
+    assert jobs[1].output_filename != jobs[0].output_filename
+    assert jobs[1].output_filename.endswith(".json")
@@ -1,13 +1,62 @@
-from dcheck_enterprise_runner.redaction import redact_string, contains_obvious_pii
+from dcheck_enterprise_runner.redaction import (
+    redact_string,
+    contains_obvious_pii,
+    redact_report_payload,
+    redact_known_fields,
+)
 
 def test_contains_obvious_pii():
     assert contains_obvious_pii("a@b.com")
     assert contains_obvious_pii("01019012345")
     assert contains_obvious_pii("+4791122334")
 
+def test_phone_requires_plus_or_separators():
+    assert contains_obvious_pii("91 12 23 34")
+    assert contains_obvious_pii("12-34-56")
+    assert not contains_obvious_pii("row_count=123456789")
+
 def test_redact_string():
     s = "mail a@b.com fnr 01019012345 phone +4791122334"
     r = redact_string(s)
     assert "a@b.com" not in r
     assert "01019012345" not in r
-    assert "+4791122334" not in r
\ No newline at end of file
+    assert "+4791122334" not in r
+
+def test_redact_report_payload_paths():
+    payload = {
+        "results": [{"message": "contact a@b.com", "metrics": {"rows": 5}}],
+        "summary": {"status_counts": {"ok": 1}},
+    }
+    out, count, paths = redact_report_payload(payload)
+    assert out["results"][0]["message"] == "contact [REDACTED_EMAIL]"
+    assert count == 1
+    assert paths == ["results[0].message"]
+
+def test_redact_report_payload_caps_paths():
+    payload = {"samples": [f"user{i}@example.com" for i in range(10)]}
+    out, count, paths = redact_report_payload(payload, path_cap=3)
+    assert count == 10
+    assert len(paths) == 3
+    assert all("@" not in s for s in out["samples"])
+
+def test_redact_known_fields():
+    payload = {
+        "results": [
+            {
+                "message": "leak a@b.com",
+                "metrics": {"sample": ["c@d.com"], "detail": {"worst": "e@f.com"}, "rows": 5},
+            }
+        ],
+        "audit": {"user": "kept@asis.com"},
+    }
+    out, count, paths = redact_known_fields(payload)
+    assert out["results"][0]["message"] == "leak [REDACTED_EMAIL]"
+    assert out["results"][0]["metrics"]["sample"] == ["[REDACTED_EMAIL]"]
+    assert out["results"][0]["metrics"]["detail"]["worst"] == "[REDACTED_EMAIL]"
+    assert out["audit"]["user"] == "kept@asis.com"
+    assert count == 3
+    assert sorted(paths) == [
+        "results[0].message",
+        "results[0].metrics.detail.worst",
+        "results[0].metrics.sample[0]",
+    ]
@@ -25,4 +25,35 @@ def test_spec_parses_minimal():
         spec = load_and_validate_spec(p)
         assert spec.run.id == "x"
         assert spec.tables[0].name == "cat.sch.tbl"
-        assert spec.tables[0].modules == ["core_quality"]
\ No newline at end of file
+        assert spec.tables[0].modules == ["core_quality"]
+
+def test_spec_rejects_empty_table_name():
+    with tempfile.TemporaryDirectory() as d:
+        p = Path(d) / "spec.yml"
+        p.write_text(
+            "run:\n  id: x\n  output_path: ./out\n"
+            "tables:\n"
+            "  - name: \"\"\n",
+            encoding="utf-8",
+        )
+        try:
+            load_and_validate_spec(p)
+            assert False, "Expected SpecError"
+        except SpecError:
+            pass
+
+def test_spec_rejects_non_string_modules():
+    with tempfile.TemporaryDirectory() as d:
+        p = Path(d) / "spec.yml"
+        p.write_text(
+            "run:\n  id: x\n  output_path: ./out\n"
+            "tables:\n"
+            "  - name: cat.sch.tbl\n"
+            "    modules: [1, 2]\n",
+            encoding="utf-8",
+        )
+        try:
+            load_and_validate_spec(p)
+            assert False, "Expected SpecError"
+        except SpecError:
+            pass